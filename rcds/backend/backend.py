@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from importlib import import_module
 from typing import TYPE_CHECKING, Any, Dict
 
@@ -38,6 +39,7 @@ class BackendsInfo:
         raise NotImplementedError()
 
 
+@lru_cache(maxsize=None)
 def load_backend_module(name: str) -> BackendsInfo:
     try:
         module = import_module(f"rcds.backends.{name}")
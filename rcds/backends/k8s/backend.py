@@ -79,6 +79,9 @@ class ContainerBackend(rcds.backend.BackendContainerRuntime):
         render_and_append(challenge_env, "namespace.yaml")
         render_and_append(challenge_env, "network-policy.yaml")
 
+        domain = self._options["domain"]
+        domain_suffix = "." + domain
+
         for container_name, container_config in challenge.config["containers"].items():
             expose_config = challenge.config.get("expose", dict()).get(
                 container_name, None
@@ -88,13 +91,13 @@ class ContainerBackend(rcds.backend.BackendContainerRuntime):
                 for expose_port in expose_config:
                     if "http" in expose_port:
                         if isinstance(expose_port["http"], str):
-                            expose_port["http"] += "." + self._options["domain"]
+                            expose_port["http"] += domain_suffix
                         else:
                             assert isinstance(expose_port["http"], dict)
                             if "raw" in expose_port["http"]:
                                 expose_port["http"] = expose_port["http"]["raw"]
                     if "tcp" in expose_port:
-                        expose_port["host"] = self._options["domain"]
+                        expose_port["host"] = domain
 
             container_env: Environment = challenge_env.overlay()
             container_env.globals["container"] = {
@@ -1,5 +1,7 @@
 import re
-from typing import Any, Callable, Dict, Iterable, List, Set
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Set
 
 from kubernetes import client  # type: ignore
 
@@ -19,6 +21,7 @@ KIND_TO_API_VERISON = {
 camel_case_to_snake_case_re = re.compile(r"(?=[A-Z])")
 
 
+@lru_cache(maxsize=None)
 def kind_to_api_method_postfix(kind: str) -> str:
     return "_namespaced" + camel_case_to_snake_case_re.sub("_", kind).lower()
 
@@ -28,10 +31,7 @@ def get_api_method_for_kind(api_client: Any, method: str, kind: str) -> Callable
 
 
 def labels_to_label_selector(labels: Dict[str, str]) -> str:
-    selector = ""
-    for k, v in labels.items():
-        selector += f"{k}={v},"
-    return selector[:-1]
+    return ",".join(f"{k}={v}" for k, v in labels.items())
 
 
 def sync_manifests(all_manifests: Iterable[Dict[str, Any]]):
@@ -45,7 +45,9 @@ def sync_manifests(all_manifests: Iterable[Dict[str, Any]]):
         "networking.k8s.io/v1": networkingv1,
     }
 
-    manifests_by_namespace_kind: Dict[str, Dict[str, List[Dict[str, Any]]]] = dict()
+    manifests_by_namespace_kind: DefaultDict[
+        str, DefaultDict[str, List[Dict[str, Any]]]
+    ] = defaultdict(lambda: defaultdict(list))
     namespaces: List[Dict[str, Any]] = []
 
     for manifest in all_manifests:
@@ -54,8 +56,6 @@ def sync_manifests(all_manifests: Iterable[Dict[str, Any]]):
             namespaces.append(manifest)
         else:
             namespace = manifest["metadata"]["namespace"]
-            manifests_by_namespace_kind.setdefault(namespace, dict())
-            manifests_by_namespace_kind[namespace].setdefault(kind, [])
             manifests_by_namespace_kind[namespace][kind].append(manifest)
 
     server_namespaces_names: Set[str] = set(
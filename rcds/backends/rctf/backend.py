@@ -1,7 +1,8 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha256
 from pathlib import Path
-from typing import Any, Dict, Set
+from typing import Any, Dict, Optional
 
 import rcds
 import rcds.backend
@@ -14,27 +15,43 @@ options_schema_validator = DefaultValidatingDraft7Validator(
     schema=load_any(Path(__file__).parent / "options.schema.yaml")
 )
 
+# Number of concurrent requests made to rCTF while committing
+MAX_WORKERS = 8
+
+# Options that may be overridden by environment variables
+ENV_OPTIONS = {"url": "RCDS_RCTF_URL", "token": "RCDS_RCTF_TOKEN"}
+
 
 class ScoreboardBackend(rcds.backend.BackendScoreboard):
     _project: rcds.Project
     _options: Dict[str, Any]
+    _sort_weights: Dict[str, int]
     _adminv1: RCTFAdminV1
 
     def __init__(self, project: rcds.Project, options: Dict[str, Any]):
         self._project = project
-        self._options = options
 
-        for option_key in ["url", "token"]:
-            env_key = f"RCDS_RCTF_{option_key.upper()}"
-            self._options[option_key] = os.environ.get(
-                env_key, self._options.get(option_key, None)
-            )
+        # Only copy the options if the environment actually overrides any
+        env_overrides = {
+            option_key: os.environ[env_key]
+            for option_key, env_key in ENV_OPTIONS.items()
+            if env_key in os.environ
+        }
+        self._options = {**options, **env_overrides} if env_overrides else options
 
         # FIXME: validate options better
         if not options_schema_validator.is_valid(self._options):
             raise ValueError("Invalid options")
 
-        self._adminv1 = RCTFAdminV1(self._options["url"], self._options["token"])
+        # sortWeight for each challenge listed in sortOrder, precomputed so that
+        # preprocessing doesn't scan the list once per challenge
+        self._sort_weights = dict()
+        for i, chall_id in enumerate(self._options.get("sortOrder", [])):
+            self._sort_weights.setdefault(chall_id, -i)
+
+        self._adminv1 = RCTFAdminV1(
+            self._options["url"], self._options["token"], max_connections=MAX_WORKERS
+        )
 
     def patch_challenge_schema(self, schema: Dict[str, Any]) -> None:
         # Disallow regex flags
@@ -80,24 +97,42 @@ class ScoreboardBackend(rcds.backend.BackendScoreboard):
                     print(f"WARNING: sortOrder specifies challenge {chall_id} which doesn't exist")
 
         # Begin actual commit
-        remote_challenges: Set[str] = set(
-            c["id"]
+        remote_challenges: Dict[str, Dict[str, Any]] = {
+            c["id"]: c
             for c in self._adminv1.list_challenges()
             if c.get("managedBy", None) == "rcds"
+        }
+        visible_challenges = [
+            challenge
+            for challenge in self._project.challenges.values()
+            if challenge.config["visible"]
+        ]
+        stale_challenges = set(remote_challenges).difference(
+            challenge.config["id"] for challenge in visible_challenges
         )
-        for challenge in self._project.challenges.values():
-            if not challenge.config["visible"]:
-                continue
-            try:
-                remote_challenges.remove(challenge.config["id"])
-            except KeyError:
-                pass
-            self.commit_challenge(challenge)
-        for chall_id in remote_challenges:
-            print(f"Deleting {chall_id}")
-            self._adminv1.delete_challenge(chall_id)
+        # Challenges are independent of each other, so commit them concurrently.
+        # On the first error, list() re-raises it and the remaining queued
+        # commits are cancelled; commits already in flight still finish, and
+        # stale challenges are not deleted. Only the first error is reported.
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            list(
+                executor.map(
+                    self.commit_challenge,
+                    visible_challenges,
+                    (
+                        remote_challenges.get(challenge.config["id"], None)
+                        for challenge in visible_challenges
+                    ),
+                )
+            )
+            if stale_challenges:
+                list(executor.map(self.delete_challenge, stale_challenges))
         return True
 
+    def delete_challenge(self, chall_id: str) -> None:
+        print(f"Deleting {chall_id}")
+        self._adminv1.delete_challenge(chall_id)
+
     def validate_challenge(self, challenge: rcds.Challenge) -> None:
         """
         Raises exception on validation fail
@@ -113,14 +148,18 @@ class ScoreboardBackend(rcds.backend.BackendScoreboard):
     def preprocess_challenge(self, challenge: rcds.Challenge) -> None:
         chall_id = challenge.config["id"]
         if "sortOrder" in self._options:
-            if chall_id in self._options["sortOrder"]:
-                challenge.config["sortWeight"] = -self._options["sortOrder"].index(
-                    chall_id
-                )
+            if chall_id in self._sort_weights:
+                challenge.config["sortWeight"] = self._sort_weights[chall_id]
             else:
                 print(f"WARNING: sortOrder specified but does not contain challenge {chall_id}")
 
-    def commit_challenge(self, challenge: rcds.Challenge) -> None:
+    def commit_challenge(
+        self, challenge: rcds.Challenge, remote: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        :param remote: The challenge as currently listed by rCTF, if it exists. If
+            every field that would be sent already matches it, the update is skipped.
+        """
         chall_id = challenge.config["id"]
         rctf_challenge: Dict[str, Any] = {"managedBy": "rcds"}
         for common_field in [
@@ -134,11 +173,12 @@ class ScoreboardBackend(rcds.backend.BackendScoreboard):
             rctf_challenge[common_field] = challenge.config[common_field]
         rctf_challenge["description"] = challenge.render_description()
         # add tags
-        rctf_challenge["tags"] = []
-        if "tags" in challenge.config:
-            for tag in challenge.config["tags"]:
-                k, v = next(iter(tag.items()))
-                rctf_challenge["tags"].append({"name": v, "metatag": k})
+        # the schema guarantees each tag is a single-key {metatag: name} mapping
+        rctf_challenge["tags"] = [
+            {"name": v, "metatag": k}
+            for tag in challenge.config.get("tags", [])
+            for k, v in tag.items()
+        ]
 
         if challenge.config["event"] != "":
             rctf_challenge["tags"].append({"name": challenge.config["event"], "metatag": "event"})
@@ -179,10 +219,16 @@ class ScoreboardBackend(rcds.backend.BackendScoreboard):
                 }
             ),
         )
+        # Sort by name so the list doesn't depend on which files were just uploaded
         rctf_challenge["files"] = [
-            {"name": name, "url": url} for name, url in file_urls.items()
+            {"name": name, "url": url} for name, url in sorted(file_urls.items())
         ]
 
+        if remote is not None and all(
+            remote.get(k, None) == v for k, v in rctf_challenge.items()
+        ):
+            # Already up to date
+            return
         self._adminv1.put_challenge(chall_id, rctf_challenge)
 
 
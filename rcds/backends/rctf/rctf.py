@@ -1,22 +1,61 @@
+import json
 from base64 import b64encode
 from typing import Any, Dict, List, Optional
 from urllib.parse import quote, urljoin
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from requests_toolbelt.sessions import BaseUrlSession  # type: ignore
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(data: Any) -> bytes:
+    # Sort keys so that equal payloads always serialize to the same bytes
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, separators=(",", ":"), sort_keys=True).encode()
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class RCTFAdminV1:
 
     session: requests.Session
 
-    def __init__(self, endpoint: str, login_token: Optional[str]):
+    def __init__(
+        self,
+        endpoint: str,
+        login_token: Optional[str],
+        max_connections: int = DEFAULT_POOLSIZE,
+    ):
+        """
+        :param max_connections: Number of connections to keep open to rCTF; should
+            match the number of threads making requests concurrently
+        """
         self.session = BaseUrlSession(urljoin(endpoint, "api/v1/admin/"))
+        # All requests go to a single host, so one pool sized for the number of
+        # concurrent requests is enough
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
         if login_token is not None:
-            login_resp = requests.post(
-                urljoin(endpoint, "api/v1/auth/login"), json={"teamToken": login_token}
-            ).json()
+            # Log in over the same session so the connection is reused
+            login_resp = _loads(
+                self.session.post(
+                    urljoin(endpoint, "api/v1/auth/login"),
+                    data=_dumps({"teamToken": login_token}),
+                    headers={"Content-Type": "application/json"},
+                ).content
+            )
             if login_resp["kind"] == "goodLogin":
                 auth_token = login_resp["data"]["authToken"]
                 self.session.headers["Authorization"] = f"Bearer {auth_token}"
@@ -25,22 +64,38 @@ class RCTFAdminV1:
                     f"Invalid login_token provided (reason: {login_resp['kind']})"
                 )
 
+    def _request(self, method: str, url: str, payload: Any = None) -> Any:
+        """
+        Make a request to the admin API, (de)serializing JSON with orjson if
+        available
+        """
+        if payload is None:
+            r = self.session.request(method, url)
+        else:
+            r = self.session.request(
+                method,
+                url,
+                data=_dumps(payload),
+                headers={"Content-Type": "application/json"},
+            )
+        return _loads(r.content)
+
     @staticmethod
     def assertResponseKind(response: Any, kind: str) -> None:
         if response["kind"] != kind:
             raise RuntimeError(f"Server error: {response['kind']}")
 
     def list_challenges(self) -> List[Dict[str, Any]]:
-        r = self.session.get("challs").json()
+        r = self._request("GET", "challs")
         self.assertResponseKind(r, "goodChallenges")
         return r["data"]
 
     def put_challenge(self, chall_id: str, data: Dict[str, Any]) -> None:
-        r = self.session.put("challs/" + quote(chall_id), json={"data": data}).json()
+        r = self._request("PUT", "challs/" + quote(chall_id), {"data": data})
         self.assertResponseKind(r, "goodChallengeUpdate")
 
     def delete_challenge(self, chall_id: str) -> None:
-        r = self.session.delete("challs/" + quote(chall_id)).json()
+        r = self._request("DELETE", "challs/" + quote(chall_id))
         self.assertResponseKind(r, "goodChallengeDelete")
 
     def create_upload(self, uploads: Dict[str, bytes]) -> Dict[str, str]:
@@ -54,7 +109,7 @@ class RCTFAdminV1:
             {"name": name, "data": "data:;base64," + b64encode(data).decode()}
             for name, data in uploads.items()
         ]
-        r = self.session.post("upload", json={"files": payload}).json()
+        r = self._request("POST", "upload", {"files": payload})
         self.assertResponseKind(r, "goodFilesUpload")
         return {f["name"]: f["url"] for f in r["data"]}
 
@@ -64,6 +119,6 @@ class RCTFAdminV1:
         :return: urls {name: url}
         """
         payload = [{"name": name, "sha256": sha256} for name, sha256 in files.items()]
-        r = self.session.post("upload/query", json={"uploads": payload}).json()
+        r = self._request("POST", "upload/query", {"uploads": payload})
         self.assertResponseKind(r, "goodUploadsQuery")
         return {f["name"]: f["url"] for f in r["data"]}
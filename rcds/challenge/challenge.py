@@ -12,8 +12,11 @@ if TYPE_CHECKING:
     from ..project.assets import AssetManagerContext, AssetManagerTransaction
 
 
+_scheme_re = re.compile(r".*?://")
+
+
 def _strip_scheme(url: str) -> str:
-    return re.sub(r".*?://", "", url)
+    return _scheme_re.sub("", url)
 
 
 class ChallengeLoader:
@@ -147,7 +150,7 @@ class Challenge:
         Render the challenge's description template to a string
         """
 
-        return self.project.jinja_env.from_string(self.config["description"]).render(
+        return self.project.compile_template(self.config["description"]).render(
             deep_merge(
                 dict(),
                 {"challenge": self.config},
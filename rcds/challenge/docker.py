@@ -251,7 +251,7 @@ class ContainerManager:
             container_config["image"] = self.containers[name].get_full_tag()
 
     def get_docker_image(self, container: Container) -> str:
-        image_template = self.project.jinja_env.from_string(
+        image_template = self.project.compile_template(
             self.project.config["docker"]["image"]["template"]
         )
         template_context = {
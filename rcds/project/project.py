@@ -1,8 +1,9 @@
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional
 
 import docker  # type: ignore
-from jinja2 import Environment
+from jinja2 import Environment, Template
 
 from rcds.util import SUPPORTED_EXTENSIONS, find_files
 
@@ -11,6 +12,8 @@ from ..challenge import Challenge, ChallengeLoader
 from . import config
 from .assets import AssetManager
 
+_challenge_file_names = frozenset(f"challenge.{ext}" for ext in SUPPORTED_EXTENSIONS)
+
 
 class Project:
     """
@@ -28,6 +31,7 @@ class Project:
     scoreboard_backend: Optional[BackendScoreboard] = None
 
     jinja_env: Environment
+    _template_cache: Dict[str, Template]
     docker_client: Any
 
     def __init__(
@@ -49,18 +53,49 @@ class Project:
         self.challenges = dict()
         self.asset_manager = AssetManager(self)
         self.jinja_env = Environment(autoescape=False)
+        self._template_cache = dict()
         if docker_client is not None:
             self.docker_client = docker_client
         else:
             self.docker_client = docker.from_env()
 
-    def load_all_challenges(self) -> None:
-        for ext in SUPPORTED_EXTENSIONS:
-            for chall_file in self.root.rglob(f"challenge.{ext}"):
-                path = chall_file.parent
-                self.challenges[
-                    path.relative_to(self.root)
-                ] = self.challenge_loader.load(path)
+    def _find_challenge_dirs(self) -> Iterator[Path]:
+        # Walk the tree once, rather than once per supported extension
+        for dirpath, _, filenames in os.walk(self.root):
+            if not _challenge_file_names.isdisjoint(filenames):
+                yield Path(dirpath)
+
+    def load_all_challenges(self, paths: Optional[Iterable[Path]] = None) -> None:
+        """
+        Load challenges into :attr:`challenges`
+
+        :param paths: Challenge directories to load, either absolute or relative to
+            the project root. If not given, the whole project is searched for
+            challenges.
+        """
+        if paths is None:
+            paths = self._find_challenge_dirs()
+        for path in paths:
+            path = (self.root / path).resolve()
+            self.challenges[path.relative_to(self.root)] = self.challenge_loader.load(
+                path
+            )
+
+    def compile_template(self, source: str) -> Template:
+        """
+        Compile a template string with :attr:`jinja_env`
+
+        Compiled templates are cached by their source, so templates shared between
+        challenges (or rendered repeatedly) are only parsed once.
+
+        :param str source: The template source
+        """
+        try:
+            return self._template_cache[source]
+        except KeyError:
+            template = self.jinja_env.from_string(source)
+            self._template_cache[source] = template
+            return template
 
     def get_challenge(self, relPath: Path) -> Challenge:
         return self.challenges[relPath]
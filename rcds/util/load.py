@@ -10,6 +10,9 @@ from typing import Any, Dict
 
 import yaml
 
+# Use the libyaml-backed loader if PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _normalize_jsonlike(data: Any) -> Dict[str, Any]:
     if data is None:
@@ -19,7 +22,7 @@ def _normalize_jsonlike(data: Any) -> Dict[str, Any]:
 
 def load_yaml(f: Path) -> Dict[str, Any]:
     with f.open("r") as fd:
-        return _normalize_jsonlike(yaml.safe_load(fd))
+        return _normalize_jsonlike(yaml.load(fd, Loader=_YamlLoader))
 
 
 def load_json(f: Path) -> Dict[str, Any]:
@@ -0,0 +1,171 @@
+import io
+from typing import Any, Dict
+from unittest import mock
+
+import pytest  # type: ignore
+
+from rcds.backends.rctf import backend as rctf_backend
+
+
+def _make_challenge(chall_id: str, **config: Any) -> mock.MagicMock:
+    challenge = mock.MagicMock()
+    challenge.config = {
+        "id": chall_id,
+        "name": "Challenge",
+        "author": "author",
+        "category": "category",
+        "flag": "flag{test}",
+        "tiebreakEligible": True,
+        "sortWeight": 0,
+        "event": "",
+        "visible": True,
+        **config,
+    }
+    challenge.render_description.return_value = "Description"
+    challenge.get_asset_manager_context.return_value.ls.return_value = []
+    return challenge
+
+
+@pytest.fixture
+def adminv1_cls(monkeypatch):
+    monkeypatch.delenv("RCDS_RCTF_URL", raising=False)
+    monkeypatch.delenv("RCDS_RCTF_TOKEN", raising=False)
+    with mock.patch.object(rctf_backend, "RCTFAdminV1") as cls:
+        admin = cls.return_value
+        admin.list_challenges.return_value = []
+        admin.get_url_for_files.return_value = {}
+        admin.create_upload.return_value = {}
+        yield cls
+
+
+@pytest.fixture
+def adminv1(adminv1_cls) -> mock.MagicMock:
+    return adminv1_cls.return_value
+
+
+@pytest.fixture
+def project() -> mock.MagicMock:
+    project = mock.MagicMock()
+    project.challenges = dict()
+    return project
+
+
+@pytest.fixture
+def backend(project, adminv1_cls) -> rctf_backend.ScoreboardBackend:
+    options: Dict[str, Any] = {"url": "http://rctf.example/", "token": "token"}
+    return rctf_backend.ScoreboardBackend(project, options)
+
+
+def test_pool_sized_for_workers(backend, adminv1_cls) -> None:
+    adminv1_cls.assert_called_once_with(
+        "http://rctf.example/",
+        "token",
+        max_connections=rctf_backend.MAX_WORKERS,
+    )
+
+
+def test_preprocess_sort_order(project, adminv1_cls) -> None:
+    options: Dict[str, Any] = {
+        "url": "http://rctf.example/",
+        "token": "token",
+        "sortOrder": ["a", "b", "a"],
+    }
+    backend = rctf_backend.ScoreboardBackend(project, options)
+    challenges = {
+        chall_id: _make_challenge(chall_id, sortWeight=5) for chall_id in "abc"
+    }
+    for challenge in challenges.values():
+        backend.preprocess_challenge(challenge)
+    # The first occurrence of a duplicated ID wins
+    assert challenges["a"].config["sortWeight"] == 0
+    assert challenges["b"].config["sortWeight"] == -1
+    # Unlisted challenges keep their configured sortWeight
+    assert challenges["c"].config["sortWeight"] == 5
+
+
+def test_commit_error_skips_deletions(backend, project, adminv1) -> None:
+    project.challenges = {
+        "ok": _make_challenge("ok"),
+        "broken": _make_challenge("broken"),
+    }
+    adminv1.list_challenges.return_value = [{"id": "stale", "managedBy": "rcds"}]
+
+    def put_challenge(chall_id: str, data: Dict[str, Any]) -> None:
+        if chall_id == "broken":
+            raise RuntimeError("Server error: badChallenge")
+
+    adminv1.put_challenge.side_effect = put_challenge
+    with pytest.raises(RuntimeError, match="badChallenge"):
+        backend.commit()
+    adminv1.delete_challenge.assert_not_called()
+
+
+def test_commit_deletes_stale(backend, project, adminv1) -> None:
+    project.challenges = {"ok": _make_challenge("ok")}
+    adminv1.list_challenges.return_value = [
+        {"id": "ok", "managedBy": "rcds"},
+        {"id": "stale", "managedBy": "rcds"},
+        {"id": "unmanaged"},
+    ]
+    backend.commit()
+    adminv1.delete_challenge.assert_called_once_with("stale")
+
+
+def _committed_data(backend, adminv1, challenge) -> Dict[str, Any]:
+    backend.commit_challenge(challenge, None)
+    adminv1.put_challenge.assert_called_once()
+    chall_id, data = adminv1.put_challenge.call_args[0]
+    assert chall_id == challenge.config["id"]
+    adminv1.put_challenge.reset_mock()
+    return data
+
+
+def test_commit_challenge_no_remote(backend, adminv1) -> None:
+    challenge = _make_challenge("chall")
+    backend.commit_challenge(challenge, None)
+    adminv1.put_challenge.assert_called_once()
+
+
+def test_commit_challenge_skips_unchanged(backend, adminv1) -> None:
+    challenge = _make_challenge("chall")
+    remote = {"id": "chall", **_committed_data(backend, adminv1, challenge)}
+    backend.commit_challenge(challenge, remote)
+    adminv1.put_challenge.assert_not_called()
+
+
+@pytest.mark.parametrize("field", ["name", "description", "points", "files"])
+def test_commit_challenge_sends_changed(backend, adminv1, field: str) -> None:
+    challenge = _make_challenge("chall")
+    remote = {"id": "chall", **_committed_data(backend, adminv1, challenge)}
+    remote[field] = "outdated"
+    backend.commit_challenge(challenge, remote)
+    adminv1.put_challenge.assert_called_once()
+
+
+def test_commit_challenge_sends_missing(backend, adminv1) -> None:
+    challenge = _make_challenge("chall")
+    remote = {"id": "chall", **_committed_data(backend, adminv1, challenge)}
+    del remote["tags"]
+    backend.commit_challenge(challenge, remote)
+    adminv1.put_challenge.assert_called_once()
+
+
+def test_commit_challenge_files_sorted(backend, adminv1) -> None:
+    challenge = _make_challenge("chall")
+    am_ctx = challenge.get_asset_manager_context.return_value
+    am_ctx.ls.return_value = ["b.txt", "a.txt"]
+    am_ctx.get.return_value.open.side_effect = lambda mode: io.BytesIO(b"data")
+    am_ctx.get.return_value.read_bytes.return_value = b"data"
+    # b.txt was uploaded previously, a.txt is new
+    adminv1.get_url_for_files.return_value = {"a.txt": None, "b.txt": "/b.txt"}
+    adminv1.create_upload.return_value = {"a.txt": "/a.txt"}
+    data = _committed_data(backend, adminv1, challenge)
+    assert data["files"] == [
+        {"name": "a.txt", "url": "/a.txt"},
+        {"name": "b.txt", "url": "/b.txt"},
+    ]
+
+    # Same files, now both already uploaded in the opposite order
+    adminv1.get_url_for_files.return_value = {"b.txt": "/b.txt", "a.txt": "/a.txt"}
+    backend.commit_challenge(challenge, {"id": "chall", **data})
+    adminv1.put_challenge.assert_not_called()
@@ -0,0 +1,88 @@
+import json
+from typing import Any, Dict, List
+from unittest import mock
+
+import pytest  # type: ignore
+import requests
+
+from rcds.backends.rctf import rctf
+from rcds.backends.rctf.rctf import RCTFAdminV1
+
+ENDPOINT = "http://rctf.example/"
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_impl(request, monkeypatch) -> str:
+    if request.param == "json":
+        monkeypatch.setattr(rctf, "orjson", None)
+    elif rctf.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+@pytest.fixture
+def responses(json_impl) -> List[Dict[str, Any]]:
+    """
+    Responses returned by the stubbed session, in order
+    """
+    return []
+
+
+@pytest.fixture
+def session_request(responses):
+    def request(self, method: str, url: str, **kwargs: Any) -> mock.MagicMock:
+        resp = mock.MagicMock()
+        resp.content = json.dumps(responses.pop(0)).encode()
+        return resp
+
+    with mock.patch.object(
+        requests.Session, "request", autospec=True, side_effect=request
+    ) as stub:
+        yield stub
+
+
+def test_login(responses, session_request) -> None:
+    responses.append({"kind": "goodLogin", "data": {"authToken": "auth"}})
+    adminv1 = RCTFAdminV1(ENDPOINT, "team-token")
+    session_request.assert_called_once()
+    _, method, url = session_request.call_args[0]
+    kwargs = session_request.call_args[1]
+    assert method == "POST"
+    assert url == ENDPOINT + "api/v1/auth/login"
+    assert json.loads(kwargs["data"]) == {"teamToken": "team-token"}
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert adminv1.session.headers["Authorization"] == "Bearer auth"
+
+
+def test_bad_login(responses, session_request) -> None:
+    responses.append({"kind": "badToken"})
+    with pytest.raises(ValueError, match="badToken"):
+        RCTFAdminV1(ENDPOINT, "team-token")
+
+
+def test_put_challenge(responses, session_request) -> None:
+    adminv1 = RCTFAdminV1(ENDPOINT, None)
+    responses.append({"kind": "goodChallengeUpdate"})
+    adminv1.put_challenge("chall", {"name": "Challenge", "author": "author"})
+    _, method, url = session_request.call_args[0]
+    kwargs = session_request.call_args[1]
+    assert method == "PUT"
+    assert url == ENDPOINT + "api/v1/admin/challs/chall"
+    assert kwargs["data"] == b'{"data":{"author":"author","name":"Challenge"}}'
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+
+
+def test_list_challenges(responses, session_request) -> None:
+    adminv1 = RCTFAdminV1(ENDPOINT, None)
+    responses.append({"kind": "goodChallenges", "data": [{"id": "chall"}]})
+    assert adminv1.list_challenges() == [{"id": "chall"}]
+    _, method, url = session_request.call_args[0]
+    assert method == "GET"
+    assert url == ENDPOINT + "api/v1/admin/challs"
+
+
+def test_server_error(responses, session_request) -> None:
+    adminv1 = RCTFAdminV1(ENDPOINT, None)
+    responses.append({"kind": "badChallenge"})
+    with pytest.raises(RuntimeError, match="badChallenge"):
+        adminv1.delete_challenge("chall")
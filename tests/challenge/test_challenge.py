@@ -18,20 +18,15 @@ def loader(project) -> ChallengeLoader:
     return ChallengeLoader(project)
 
 
-def test_load_yaml_challenge(project: Project, loader: ChallengeLoader) -> None:
-    chall = loader.load(project.root / "yaml")
+@pytest.mark.parametrize("chall_dir", ["yaml", "json"])
+def test_load_challenge(
+    project: Project, loader: ChallengeLoader, chall_dir: str
+) -> None:
+    chall = loader.load(project.root / chall_dir)
     assert chall.config["name"] == "Challenge"
     assert chall.config["description"] == "Description"
-    assert chall.get_relative_path() == Path("yaml")
-    assert chall.config["id"] == "yaml"
-
-
-def test_load_json_challenge(project: Project, loader: ChallengeLoader) -> None:
-    chall = loader.load(project.root / "json")
-    assert chall.config["name"] == "Challenge"
-    assert chall.config["description"] == "Description"
-    assert chall.get_relative_path() == Path("json")
-    assert chall.config["id"] == "json"
+    assert chall.get_relative_path() == Path(chall_dir)
+    assert chall.config["id"] == chall_dir
 
 
 def test_override_challenge_id(project: Project, loader: ChallengeLoader) -> None:
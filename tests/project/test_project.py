@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import pytest  # type: ignore
+
+import rcds
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> rcds.Project:
+    (tmp_path / "rcds.yml").write_text("")
+    for chall_dir, cfg_file in [
+        ("yaml", "challenge.yml"),
+        ("category/json", "challenge.json"),
+        ("category/nested/yaml", "challenge.yaml"),
+    ]:
+        (tmp_path / chall_dir).mkdir(parents=True)
+        if cfg_file.endswith(".json"):
+            cfg = '{"name": "Challenge", "description": "Description"}'
+        else:
+            cfg = "name: Challenge\ndescription: Description\n"
+        (tmp_path / chall_dir / cfg_file).write_text(cfg)
+    (tmp_path / "not-a-challenge").mkdir()
+    (tmp_path / "not-a-challenge" / "challenge.txt").write_text("")
+    return rcds.Project(tmp_path)
+
+
+def test_load_all_challenges(project: rcds.Project) -> None:
+    project.load_all_challenges()
+    assert set(project.challenges.keys()) == {
+        Path("yaml"),
+        Path("category/json"),
+        Path("category/nested/yaml"),
+    }
+    assert project.get_challenge(Path("category/json")).config["id"] == "json"
+
+
+def test_load_all_challenges_paths(project: rcds.Project) -> None:
+    project.load_all_challenges(
+        [Path("yaml"), project.root / "category" / "nested" / "yaml"]
+    )
+    assert set(project.challenges.keys()) == {
+        Path("yaml"),
+        Path("category/nested/yaml"),
+    }
+
+
+def test_load_all_challenges_unresolved_paths(project: rcds.Project) -> None:
+    (project.root / "link").symlink_to(project.root / "yaml")
+    project.load_all_challenges(
+        [
+            project.root / "category" / ".." / "yaml",
+            Path("category/../yaml"),
+            project.root / "link",
+        ]
+    )
+    assert set(project.challenges.keys()) == {Path("yaml")}
+
+
+def test_compile_template_cached(project: rcds.Project) -> None:
+    template = project.compile_template("{{ foo }}")
+    assert template is project.compile_template("{{ foo }}")
+    assert template.render(foo="bar") == "bar"